@@ -29,7 +29,7 @@ The core of the logic is design to be extensible with extensions modules. See `p
 
 from pathlib import Path
 import types
-from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, Type, Any, cast, overload
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union, Type, Any, cast, overload
 import inspect
 import os.path
 import sys
@@ -107,6 +107,8 @@ class ApiObject(_model.ApiObject):
         """
         Aliases to this object.
         """
+        # Same as aliases, as a set for fast membership checks when populating the list.
+        self._aliases_set: Set['Variable'] = set()
     
     # help mypy
     root: TreeRoot
@@ -413,6 +415,8 @@ class Class(_model.Class, ApiObject):
         """
         The direct subclasses of this class. 
         """
+        # Same as subclasses, as a set for fast membership checks when populating the list.
+        self._subclasses_set: Set['Class'] = set()
 
         self.constructor_method: Optional['Function'] = None
         """
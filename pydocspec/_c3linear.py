@@ -8,7 +8,7 @@ Implements `Class.mro` attribute.
 
 import abc
 from itertools import islice
-from typing import Generic, List, Optional, TypeVar, Deque
+from typing import Dict, Generic, List, TypeVar
 
 T = TypeVar('T')
 
@@ -17,95 +17,47 @@ class GenericMRO(Generic[T], abc.ABC):
     Generic class to encapsulate the c3 linearizations for any kind of class types.
     """
 
-    class Dependency(Deque[Optional['T']]):
-        @property
-        def head(self) -> Optional['T']:
-            try:
-                return self[0]
-            except IndexError:
-                return None
-        @property
-        def tail(self) -> islice:  # type: ignore
-            """
-            Return islice object, which is suffice for iteration or calling `in`
-            """
-            try:
-                return islice(self, 1, self.__len__())
-            except (ValueError, IndexError):
-                return islice([], 0, 0)
+    def _merge(self, *lists: List['T']) -> List['T']:
 
-    class DependencyList:
-        """
-        A class represents list of linearizations (dependencies)
-        The last element of DependencyList is a list of parents.
-        It's needed  to the merge process preserves the local
-        precedence order of direct parent classes.
-        """
-        def __init__(self, *lists: List[Optional['T']]) -> None:
-            self._lists = [GenericMRO.Dependency(i) for i in lists]
-
-        def __contains__(self, item: 'T') -> bool:
-            """
-            Return True if any linearization's tail contains an item
-            """
-            return any([item in l.tail for l in self._lists])  # type: ignore
-
-        def __len__(self) -> int:
-            size = len(self._lists)
-            return (size - 1) if size else 0
-
-        def __repr__(self) -> str:
-            return self._lists.__repr__()
-
-        @property
-        def heads(self) -> List[Optional['T']]:
-            return [h.head for h in self._lists]
-
-        @property
-        def tails(self) -> 'DependencyList':  # type: ignore
-            """
-            Return self so that __contains__ could be called
-            Used for readability reasons only
-            """
-            return self
-
-        @property
-        def exhausted(self) -> bool:
-            """
-            Return True if all elements of the lists are exhausted
-            """
-            return all(map(lambda x: len(x) == 0, self._lists))
-
-        def remove(self, item: Optional['T']) -> None:
-            """
-            Remove an item from the lists
-            Once an item removed from heads, the leftmost elements of the tails
-            get promoted to become the new heads.
-            """
-            for i in self._lists:
-                if i and i.head == item:
-                    i.popleft()
-
-    def _merge(self, *lists: List[Optional['T']]) -> List[Optional['T']]:
-
-        result: List[Optional['T']] = []
-        linearizations = GenericMRO.DependencyList(*lists)
+        result: List['T'] = []
+        
+        # Instead of popping the heads of the linearizations, we advance a cursor in each list
+        # and keep track of the number of tails each item appears in: a head is a 
+        # good candidate when it's not in any tail.
+        cursors = [0] * len(lists)
+        in_tails: Dict[int, int] = {}
+        for l in lists:
+            for item in islice(l, 1, None):
+                in_tails[id(item)] = in_tails.get(id(item), 0) + 1
 
         while True:
-            if linearizations.exhausted:
-                return result
-
-            for head in linearizations.heads:
-                if head and (head not in linearizations.tails): 
-                    result.append(head) # type: ignore
-                    linearizations.remove(head)
-
-                    # Once candidate is found, continue iteration
-                    # from the first element of the list
-                    break
-            else:
-                # Loop never broke, no linearization could possibly be found
+            candidate_found = False
+            for l, pos in zip(lists, cursors):
+                if pos < len(l):
+                    head = l[pos]
+                    if not in_tails.get(id(head)):
+                        candidate_found = True
+                        # Once candidate is found, continue iteration
+                        # from the first element of the list
+                        break
+            
+            if not candidate_found:
+                if all(pos == len(l) for l, pos in zip(lists, cursors)):
+                    return result
+                # no linearization could possibly be found
                 raise ValueError('Cannot compute c3 linearization')
+            
+            result.append(head)
+            
+            # Remove the item from the heads of the lists. 
+            # The leftmost elements of the tails get promoted to become the new heads.
+            for i, l in enumerate(lists):
+                pos = cursors[i]
+                if pos < len(l) and l[pos] == head:
+                    pos += 1
+                    cursors[i] = pos
+                    if pos < len(l):
+                        in_tails[id(l[pos])] -= 1
 
     @abc.abstractmethod
     def bases(self, cls: 'T') -> List['T']:
@@ -118,12 +70,22 @@ class GenericMRO(Generic[T], abc.ABC):
         """
         Return a list of classes in order corresponding to Python's MRO.
         """
+        return self._mro(cls, {})
+
+    def _mro(self, cls: 'T', cache: Dict[int, List['T']]) -> List['T']:
+        # The cache holds the linearizations computed during the current mro() call, 
+        # such that classes appearing several times in the hierarchy (i.e. diamonds) are linearized once.
+        try:
+            return cache[id(cls)]
+        except KeyError:
+            pass
         
         result: List['T'] = [cls]
         _bases = self.bases(cls)
         
-        if not _bases:
-            return result
-        else:
-            return result + self._merge(*[self.mro(kls) for kls in _bases], _bases) # type: ignore
+        if _bases:
+            result += self._merge(*[self._mro(kls, cache) for kls in _bases], _bases) # type: ignore
+        
+        cache[id(cls)] = result
+        return result
 
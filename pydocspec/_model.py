@@ -40,6 +40,7 @@ if TYPE_CHECKING:
     import pydocspec
     import astroid.nodes
 
+_LOG = logging.getLogger('pydocspec')
 
 def tree_repr(obj: 'pydocspec.ApiObject', 
               full_name:bool=False, 
@@ -76,7 +77,7 @@ class CanTriggerWarnings:
         if self.location:
             lineno = self.location.lineno + lineno_offset
             filename = self.location.filename or filename
-        logging.getLogger('pydocspec').warning(f'{filename}:{lineno}: {msg}')
+        _LOG.warning(f'{filename}:{lineno}: {msg}')
 
 # Adapted from https://github.com/pawamoy/griffe
 # Copyright (c) 2021, Timothée Mazzucotelli
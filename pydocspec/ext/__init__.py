@@ -273,8 +273,9 @@ def _get_setup_extension_func_from_module(module: str) -> Callable[[ExtRegistrar
     """
     mod = importlib.import_module(module)
     
-    if hasattr(mod, 'setup_extension'):
-        if callable(mod.setup_extension):
-            return cast('Callable[[ExtRegistrar], None]', mod.setup_extension)
-        raise ValueError(f"{mod}.setup_extension should be a callable, got {mod.setup_extension}.")
-    raise ValueError(f"{mod}.setup_extension() function not found.")
+    setup_extension = getattr(mod, 'setup_extension', None)
+    if setup_extension is None:
+        raise ValueError(f"{mod}.setup_extension() function not found.")
+    if callable(setup_extension):
+        return cast('Callable[[ExtRegistrar], None]', setup_extension)
+    raise ValueError(f"{mod}.setup_extension should be a callable, got {setup_extension}.")
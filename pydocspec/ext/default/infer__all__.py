@@ -5,33 +5,43 @@ import astroid.util
 import astroid.inference
 import astroid.helpers
 
-from pydocspec import _model, astroidutils, ext, visitors
+from pydocspec import _model, astroidutils, ext
 from pydocspec.processor import helpers
 
-class Infer__all__Operations(visitors.AstVisitor):
+class Infer__all__Operations:
     """
     Walks the module level ast tree and infer list operations results to ``self.names``. 
     """
 
     SUPPORTED_OPS = set(('append', 'extend', 'remove'))
 
+    # Ignore operations inside functions, classes and comprehensions.
+    SKIPPED_NODES = (astroid.nodes.ClassDef, 
+                     astroid.nodes.Lambda, 
+                     astroid.nodes.FunctionDef, 
+                     astroid.nodes.AsyncFunctionDef, 
+                     astroid.nodes.DictComp, 
+                     astroid.nodes.GeneratorExp, 
+                     astroid.nodes.ListComp, 
+                     astroid.nodes.SetComp, )
+
     def __init__(self, names: List[str], mod: _model.ApiObject) -> None:
-        super().__init__(extensions=None)
         self.names = names
         self.mod = mod
 
-    def _skip(self, o:Any) -> None:
-        raise self.SkipNode()
-
-    # Ignore operations inside functions, classes and comprehensions.
-    visit_ClassDef = _skip
-    visit_Lambda = _skip
-    visit_FunctionDef = _skip
-    visit_AsyncFunctionDef = _skip
-    visit_DictComp = _skip
-    visit_GeneratorExp = _skip
-    visit_ListComp = _skip
-    visit_SetComp = _skip
+    def walk(self, node: astroid.nodes.NodeNG) -> None:
+        """
+        Visit all calls in the tree, in order, skipping the nodes listed in `SKIPPED_NODES`.
+        """
+        # Only Call nodes are of interest, so this doesn't need the generic visitor machinery.
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, self.SKIPPED_NODES):
+                continue
+            if isinstance(node, astroid.nodes.Call):
+                self.visit_Call(node)
+            stack.extend(reversed(list(astroidutils.iter_values(node))))
     
     def visit_Call(self, node: astroid.nodes.Call) -> None:
         
@@ -54,19 +64,25 @@ class Infer__all__Operations(visitors.AstVisitor):
                           lineno_offset=node.lineno)
             return
 
-        # Infer argument value
-        ivalue = astroid.helpers.safe_infer(node.args[0]) # Safe inference.
-        if ivalue in (astroid.util.Uninferable, None):
-            self.mod.warn(f"Can't infer '__all__.{meth}()' argument value.", 
-                          lineno_offset=node.lineno)
-            return
-        
-        try:
-            value = astroidutils.literal_eval(ivalue)
-        except ValueError as e:
-            self.mod.warn(f"Can't infer '__all__.{meth}()' argument value. {e}", 
-                          lineno_offset=node.lineno)
-            return
+        arg = node.args[0]
+        value: Any
+        if isinstance(arg, astroid.nodes.Const):
+            # Most common case: __all__.append('name'), no need to infer anything.
+            value = arg.value
+        else:
+            # Infer argument value
+            ivalue = astroid.helpers.safe_infer(arg) # Safe inference.
+            if ivalue in (astroid.util.Uninferable, None):
+                self.mod.warn(f"Can't infer '__all__.{meth}()' argument value.", 
+                              lineno_offset=node.lineno)
+                return
+            
+            try:
+                value = astroidutils.literal_eval(ivalue)
+            except ValueError as e:
+                self.mod.warn(f"Can't infer '__all__.{meth}()' argument value. {e}", 
+                              lineno_offset=node.lineno)
+                return
 
         if meth == 'append':
             if not isinstance(value, (str,)):
@@ -4,10 +4,18 @@ General purpose visitor pattern implementation, with extensions.
 from collections import defaultdict
 import enum
 import abc
-from typing import Dict, Generic, Iterable, List, Optional, Type, TypeVar, Union
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, Type, TypeVar, Union
 
 T = TypeVar("T")
 
+class _WalkaboutFrame(Generic[T]):
+  # An object being walked by walkabout().
+  __slots__ = ('ob', 'children', 'call_depart')
+  def __init__(self, ob: T, children: Iterator[T], call_depart: bool) -> None:
+    self.ob = ob
+    self.children = children
+    self.call_depart = call_depart
+
 class Visitor(Generic[T], abc.ABC):
   """
   "Visitor" pattern abstract superclass implementation for tree traversals.
@@ -54,17 +62,34 @@ class Visitor(Generic[T], abc.ABC):
     children and siblings are not affected.
     """
 
+  # Dispatch tables: object class -> bound method. 
+  # Created by _find_method() on first use since subclasses are not required to call Visitor.__init__().
+  _visit_methods: Dict[type, Callable[[T], None]]
+  _depart_methods: Dict[type, Callable[[T], None]]
+
   def visit(self, ob: T) -> None:
     """Visit an object."""
-    method = 'visit_' + ob.__class__.__name__
-    visitor = getattr(self, method, getattr(self, method.lower(), self.unknown_visit))
+    try:
+      visitor = self._visit_methods[ob.__class__]
+    except (AttributeError, KeyError):
+      visitor = self._find_method('visit_', ob.__class__, self.unknown_visit)
     visitor(ob)
   
   def depart(self, ob: T) -> None:
     """Depart an object."""
-    method = 'depart_' + ob.__class__.__name__
-    visitor = getattr(self, method, getattr(self, method.lower(), self.unknown_departure))
+    try:
+      visitor = self._depart_methods[ob.__class__]
+    except (AttributeError, KeyError):
+      visitor = self._find_method('depart_', ob.__class__, self.unknown_departure)
     visitor(ob)
+
+  def _find_method(self, prefix: str, klass: type, default: Callable[[T], None]) -> Callable[[T], None]:
+    # Look up the method and store it in the '_visit_methods' or '_depart_methods' table.
+    methods: Dict[type, Callable[[T], None]] = self.__dict__.setdefault(f'_{prefix}methods', {})
+    name = prefix + klass.__name__
+    method: Callable[[T], None] = getattr(self, name, getattr(self, name.lower(), default))
+    methods[klass] = method
+    return method
   
   def unknown_visit(self, ob: T) -> None:
     """
@@ -103,18 +128,30 @@ class Visitor(Generic[T], abc.ABC):
     :param visitor: A `Visitor` object, containing a
         ``visit`` implementation for each object type encountered.
     :param get_children: A callable that returns the children of an object. 
+    :note: The traversal is iterative, so it's not limited by the recursion depth.
     """
+    # Stack of iterators on the children of the objects being walked.
+    stack: List[Iterator[T]] = []
+    self._walk_enter(ob, stack)
+    while stack:
+      try:
+        child = next(stack[-1])
+      except StopIteration:
+        stack.pop()
+        continue
+      try:
+        self._walk_enter(child, stack)
+      except self.SkipSiblings:
+        stack.pop()
+  
+  def _walk_enter(self, ob: T, stack: List[Iterator[T]]) -> None:
     try:
       self.visit(ob)
     except (self.SkipChildren, self.SkipNode):
       return
     except self.SkipDeparture:           
       pass # not applicable; ignore
-    try:
-      for child in self.get_children(ob):
-          self.walk(child)
-    except self.SkipSiblings:
-      pass
+    stack.append(iter(self.get_children(ob)))
     
   def walkabout(self, ob: T) -> None:
     """
@@ -125,24 +162,44 @@ class Visitor(Generic[T], abc.ABC):
     :param visitor: A `Visitor` object, containing a
         ``visit`` and ``depart`` implementation for each concrete object type encountered.
     :param get_children: A callable that returns the children of an object. 
+    :note: The traversal is iterative, so it's not limited by the recursion depth.
     """
-    call_depart = True
-    try:
-      try:
-        self.visit(ob)
-      except self.SkipNode:
-        return
-      except self.SkipDeparture:           
-        call_depart = False
+    stack: List[_WalkaboutFrame[T]] = []
+    self._walkabout_enter(ob, stack)
+    while stack:
+      frame = stack[-1]
       try:
-        for child in self.get_children(ob):
-            self.walkabout(child)
-      except self.SkipSiblings:
+        child = next(frame.children)
+      except StopIteration:
         pass
+      else:
+        try:
+          self._walkabout_enter(child, stack)
+        except self.SkipSiblings:
+          frame.children = iter(())
+        continue
+      stack.pop()
+      if frame.call_depart:
+        try:
+          self.depart(frame.ob)
+        except (self.SkipSiblings, self.SkipChildren):
+          # Stops visiting the siblings of the departed object.
+          if not stack:
+            raise
+          stack[-1].children = iter(())
+  
+  def _walkabout_enter(self, ob: T, stack: List[_WalkaboutFrame[T]]) -> None:
+    call_depart = True
+    try:
+      self.visit(ob)
+    except self.SkipNode:
+      return
+    except self.SkipDeparture:           
+      call_depart = False
     except self.SkipChildren:
-      pass
-    if call_depart:
-      self.depart(ob)
+      stack.append(_WalkaboutFrame(ob, iter(()), True))
+      return
+    stack.append(_WalkaboutFrame(ob, iter(self.get_children(ob)), call_depart))
   
   @abc.abstractclassmethod
   def get_children(cls, ob: T) -> Iterable[T]:
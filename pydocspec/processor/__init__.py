@@ -4,9 +4,10 @@ Processes the half baked model created by the builder to populate buch of fancy
 
 from importlib import import_module
 import logging
-from typing import Any, Callable, Dict, List, Optional, Set, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 import attr
+import astroid.nodes
 import pydocspec
 from pydocspec import _model, visitors
 
@@ -28,9 +29,15 @@ class _MroFromAstroidSetter(visitors.ApiObjectVisitorExt):
     correctly populate the resolved_bases attribute with our own resolve_name() function.
     """
     when = visitors.ApiObjectVisitorExt.When.BEFORE
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Lives as long as the visitor, i.e. one post-build run.
+        self._ast2apiobject_cache: Dict[astroid.nodes.NodeNG, Optional[Union[pydocspec.Class, pydocspec.Module]]] = {}
+
     def visit_Class(self, ob: pydocspec.Class) -> None:
         # This can set Class.mro attr to NotImplemented, we take of it in the regular post build visitor.
-        ob.mro = class_attr.mro_from_astroid(ob) #type:ignore[assignment]
+        ob.mro = class_attr.mro_from_astroid(ob, self._ast2apiobject_cache) #type:ignore[assignment]
 
 class _DuplicateWhoShadowsWhoHandling(visitors.ApiObjectVisitorExt):
     # Duplicate objects handling: (in post-build)
@@ -57,13 +64,8 @@ class _DuplicateWhoShadowsWhoHandling(visitors.ApiObjectVisitorExt):
                     # there is another object by the same name, place it first in the all_objects stack.
                     ob.root.all_objects[ob.full_name] = dup
     
-    def visit_Function(self, ob: pydocspec.Function) -> None:
-        # Ensures that property setter and deleters do not shadow the getter.
-        if ob.is_property_deleter or \
-           ob.is_property_setter:
-            for dup in ob.root.all_objects.getdup(ob.full_name):
-                if isinstance(dup, pydocspec.Function) and dup.is_property:
-                    ob.root.all_objects[ob.full_name] = dup
+    # Property setters and deleters are handled after the second walk, 
+    # since the Function.is_property* attributes are not set yet. 
     
     # TODO: same for overload functions, other instances of the issue ?
 
@@ -76,6 +78,15 @@ class _DocSourcesSetter(visitors.ApiObjectVisitorExt):
 
 class PostBuildVisitor1(visitors.ApiObjectVisitor):
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Lives as long as the visitor, i.e. one post-build run.
+        self._expand_cache: Dict[Tuple[pydocspec.ApiObject, str], str] = {}
+        # Full names of the property setters and deleters.
+        self._property_accessors: Set[str] = set()
+        # Flags of the functions, computed ahead of their visit by is_abstractclass().
+        self._function_flags: Dict[_model.Function, func_attr.FunctionFlags] = {}
+
     def visit_Module(self, ob: pydocspec.Module) -> None:
         if ob.dunder_all is None:
             ob.dunder_all = mod_attr.dunder_all(ob)
@@ -84,7 +95,7 @@ class PostBuildVisitor1(visitors.ApiObjectVisitor):
             ob.is_package = mod_attr.is_package(ob)
     
     def visit_Class(self, ob: pydocspec.Class) -> None:
-        ob.resolved_bases = class_attr.resolved_bases(ob)        
+        ob.resolved_bases = class_attr.resolved_bases(ob, self._expand_cache)
         # we don't need to re compute the MRO if the tree has beed created from astroid,
         # so this why we compute it only if it's marked as NotImplemented (from mro_from_astroid()).
         if ob.mro == NotImplemented:
@@ -95,19 +106,22 @@ class PostBuildVisitor1(visitors.ApiObjectVisitor):
 
         ob.constructor_method = class_attr.constructor_method(ob)
         ob.inherited_members = class_attr.inherited_members(ob)
-        ob.is_abstractclass = class_attr.is_abstractclass(ob)
+        ob.is_abstractclass = class_attr.is_abstractclass(ob, self._function_flags)
 
         class_attr.process_subclasses(ob) # Setup the `pydocspec.Class.subclasses` attribute.
     
     def visit_Function(self, ob: pydocspec.Function) -> None:
-        ob.is_property = func_attr.is_property(ob)
-        ob.is_property_setter = func_attr.is_property_setter(ob)
-        ob.is_property_deleter = func_attr.is_property_deleter(ob)
-        ob.is_async = func_attr.is_async(ob)
-        ob.is_method = func_attr.is_method(ob)
-        ob.is_classmethod = func_attr.is_classmethod(ob)
-        ob.is_staticmethod = func_attr.is_staticmethod(ob)
-        ob.is_abstractmethod = func_attr.is_abstractmethod(ob)
+        flags = func_attr.analyze(ob, self._function_flags)
+        ob.is_property = flags.is_property
+        ob.is_property_setter = flags.is_property_setter
+        ob.is_property_deleter = flags.is_property_deleter
+        ob.is_async = flags.is_async
+        ob.is_method = flags.is_method
+        ob.is_classmethod = flags.is_classmethod
+        ob.is_staticmethod = flags.is_staticmethod
+        ob.is_abstractmethod = flags.is_abstractmethod
+        if flags.is_property_setter or flags.is_property_deleter:
+            self._property_accessors.add(ob.full_name)
     
     def visit_Variable(self, ob: pydocspec.Variable) -> None:
         ob.is_instance_variable = data_attr.is_instance_variable(ob)
@@ -121,12 +135,24 @@ class PostBuildVisitor1(visitors.ApiObjectVisitor):
         # c-extensions. For now, it works with pure-python.
         data_attr.process_aliases(ob)
 
+    def restore_property_getters(self, root: pydocspec.TreeRoot) -> None:
+        """
+        Ensures that property setter and deleters do not shadow the getter in `TreeRoot.all_objects`.
+        
+        Must be called after the walk, once all Function.is_property* attributes have been set. 
+        Done once per property name.
+        """
+        for full_name in self._property_accessors:
+            for dup in root.all_objects.getdup(full_name):
+                if isinstance(dup, pydocspec.Function) and dup.is_property:
+                    root.all_objects[full_name] = dup
+
     def unknown_visit(self, ob: _model.ApiObject) -> None:
         ...
     def unknown_departure(self, ob: _model.ApiObject) -> None:
         ...
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Processor:
     """
     Populate `pydocspec` attributes by applying processing to a newly created `pydocspec.TreeRoot` instance coming from the `astbuilder`. 
@@ -185,8 +211,14 @@ class Processor:
 
         # run visitors
 
-        for mod in root.root_modules: 
+        # The astroid MRO is computed in the first walk, together with the duplicates handling.
+        # It can't be fused with the second walk: resolved_bases() relies on name resolution,
+        # which calls Class.find() on classes that can be located anywhere in the tree,
+        # so the MRO of all classes must be set before the second walk starts.
+        for mod in root.root_modules:
             mod.walk(_post_build_visitor0)
 
         for mod in root.root_modules: 
             mod.walk(post_build_visitor)
+        
+        post_build_visitor.restore_property_getters(root)
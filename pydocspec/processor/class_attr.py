@@ -1,7 +1,7 @@
 """
 Helpers to populate attributes of `Class` instances. 
 """
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+from typing import Collection, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import astroid.nodes
 import astroid.exceptions
@@ -20,7 +20,10 @@ class MRO(_c3linear.GenericMRO[pydocspec.Class]):
     def bases(self, cls: pydocspec.Class) -> List[pydocspec.Class]:
         return [b for b in cls.resolved_bases if isinstance(b, pydocspec.Class)]
 
-def is_subclass_of(ob: pydocspec.Class, baseclasses: Sequence[Union[str, pydocspec.Class]]) -> bool:
+# MRO objects hold no state between mro() calls, so we can share one.
+_MRO = MRO()
+
+def is_subclass_of(ob: pydocspec.Class, baseclasses: Collection[Union[str, pydocspec.Class]]) -> bool:
     """
     Check if class ``ob`` is a subclass of any of the base classes in ``baseclasses``.
     :returns: `True` if ``ob`` is derived from any of the base classes. 
@@ -32,7 +35,7 @@ def is_subclass_of(ob: pydocspec.Class, baseclasses: Sequence[Union[str, pydocsp
     return False
 
 # List of exceptions class names in the standard library, Python 3.8.10
-EXCEPTIONS_CLASSES = ('ArithmeticError', 'AssertionError', 'AttributeError', 
+EXCEPTIONS_CLASSES = frozenset(('ArithmeticError', 'AssertionError', 'AttributeError', 
     'BaseException', 'BlockingIOError', 'BrokenPipeError', 
     'BufferError', 'BytesWarning', 'ChildProcessError', 
     'ConnectionAbortedError', 'ConnectionError', 
@@ -52,18 +55,25 @@ EXCEPTIONS_CLASSES = ('ArithmeticError', 'AssertionError', 'AttributeError',
     'SystemExit', 'TabError', 'TimeoutError', 'TypeError', 
     'UnboundLocalError', 'UnicodeDecodeError', 'UnicodeEncodeError', 
     'UnicodeError', 'UnicodeTranslateError', 'UnicodeWarning', 'UserWarning', 
-    'ValueError', 'Warning', 'ZeroDivisionError')
+    'ValueError', 'Warning', 'ZeroDivisionError'))
 
 def is_exception(ob: pydocspec.Class) -> bool: 
     """must be set after resolved_bases"""
-    return is_subclass_of(ob, EXCEPTIONS_CLASSES)
+    # Standard library exceptions are unresolved bases, so only str ancestors can match. 
+    # Stops at the first matching ancestor since ancestors() is lazy.
+    return any(isinstance(base, str) and base in EXCEPTIONS_CLASSES for base in ob.ancestors(True))
 
 
-def mro_from_astroid(ob: _model.Class) -> Union[List[pydocspec.Class], object]:
+def mro_from_astroid(ob: _model.Class, 
+                     ast2apiobject_cache: Optional[Dict[astroid.nodes.NodeNG, Optional[Union[pydocspec.Class, pydocspec.Module]]]] = None) -> Union[List[pydocspec.Class], object]:
     """
     Compute MRO from astroid, this does not require `pydocspec.Class.resolved_bases`. 
     
     Returns NotImplemented if the tree has not been built with astroid. 
+
+    :param ast2apiobject_cache: Optional mapping of class nodes to their `ApiObject`, 
+        shared between calls since the same ancestors appear in the MRO of many classes.
+        It should not outlive the processing of the tree.
     """
     # this does not support objects loaded from other places than astroid, 
     # for instance coming from JSON data.
@@ -76,7 +86,13 @@ def mro_from_astroid(ob: _model.Class) -> Union[List[pydocspec.Class], object]:
     def nodemro2classmro(node_mro: List[astroid.nodes.NodeNG]) -> List[pydocspec.Class]:
         mro_ = []
         for node in node_mro:
-            superclass = helpers.ast2apiobject(ob.root, node)
+            if ast2apiobject_cache is None:
+                superclass = helpers.ast2apiobject(ob.root, node)
+            else:
+                try:
+                    superclass = ast2apiobject_cache[node]
+                except KeyError:
+                    superclass = ast2apiobject_cache[node] = helpers.ast2apiobject(ob.root, node)
             if superclass is not None:
                 assert isinstance(superclass, pydocspec.Class)
                 mro_.append(superclass)
@@ -101,11 +117,10 @@ def mro(ob: pydocspec.Class) -> List[pydocspec.Class]:
     """compute mro from apiobjects. must be set after resolved_bases"""
     try:
         try: 
-            return MRO().mro(ob)
+            return _MRO.mro(ob)
         except (ValueError,) as e:
             ob.warn(str(e))
-            return list(
-                filter(lambda ob: isinstance(ob, pydocspec.Class), ob.ancestors(True))) #type:ignore[arg-type]
+            return [a for a in ob.ancestors(True) if isinstance(a, pydocspec.Class)]
     except RecursionError as e:
         # TODO: test recursions in base classes.
         raise RecursionError(f"Recursion error trying to resolve the MRO of class {ob.full_name!r}.")
@@ -125,9 +140,14 @@ def mro(ob: pydocspec.Class) -> List[pydocspec.Class]:
 # else:
 #     objs.append(resolved)
 
-def resolved_bases(ob: pydocspec.Class) -> List[Union['pydocspec.Class', 'str']]: 
+def resolved_bases(ob: pydocspec.Class, 
+                   expand_cache: Optional[Dict[Tuple[pydocspec.ApiObject, str], str]] = None) -> List[Union['pydocspec.Class', 'str']]: 
     """direct bases of this class, if the name cannot be resolved as an apiobject, fallback to expanded name str.
     uses name resolution.
+
+    :param expand_cache: Optional mapping of ``(scope, name)`` to expanded names, 
+        shared between calls to avoid expanding the same base names over and over (i.e. many classes inheriting from ``Exception``).
+        It should not outlive the processing of the tree.
     """
     # Uses the name resolving feature, but the name resolving feature also depends on Class.find, wich depends on resolved_bases.
     # So this is a source of potentially subtle bugs in the name resolving when there is a base class that is actually defined 
@@ -150,19 +170,26 @@ def resolved_bases(ob: pydocspec.Class) -> List[Union['pydocspec.Class', 'str']]
     
     objs: List[Union['pydocspec.Class', 'str']] = []
 
-    _workable_bases_as_string = []
-
     # use AST it should be set by the builder or converter!
     for node in ob.bases_ast or ():
-        name = astroidutils.node2dottedname(node)
-        if name:
-            _workable_bases_as_string.append('.'.join(name))
+        if isinstance(node, astroid.nodes.Name):
+            # Most bases are simple names.
+            base = node.name
         else:
-            ob.warn(f"Could not understand base {node.as_string()!r}")
+            name = astroidutils.node2dottedname(node)
+            if not name:
+                ob.warn(f"Could not understand base {node.as_string()!r}")
+                continue
+            base = '.'.join(name)
 
-    for base in _workable_bases_as_string:
-        
-        expanded_name = ob.parent.expand_name(base)
+        if expand_cache is None:
+            expanded_name = ob.parent.expand_name(base)
+        else:
+            key = (ob.parent, base)
+            try:
+                expanded_name = expand_cache[key]
+            except KeyError:
+                expanded_name = expand_cache[key] = ob.parent.expand_name(base)
 
         resolved = ob.root.all_objects.get(expanded_name)
         
@@ -189,7 +216,8 @@ def resolved_bases(ob: pydocspec.Class) -> List[Union['pydocspec.Class', 'str']]
 def process_subclasses(ob: pydocspec.Class) -> None:
     """for all resolved_bases classes, add ob to the subclasses list"""
     for b in ob.resolved_bases:
-        if isinstance(b, pydocspec.Class) and ob not in b.subclasses:
+        if isinstance(b, pydocspec.Class) and ob not in b._subclasses_set:
+            b._subclasses_set.add(ob)
             b.subclasses.append(ob)
 
 def constructor_method(ob: _model.Class) -> Optional['pydocspec.Function']:
@@ -203,15 +231,23 @@ def constructor_method(ob: _model.Class) -> Optional['pydocspec.Function']:
 def inherited_members(ob: pydocspec.Class) -> List[pydocspec.ClassInheritedMember]:
     """provide inherited_members property"""
     _inherited_members: Dict[str, pydocspec.ClassInheritedMember] = {}
-    for baselist in _nested_bases(ob):
-        #  If the class has super class
-        if len(baselist) >= 2:
-            attrs = _unmasked_attrs(baselist)
-            if attrs:
-                for attr in attrs:
-                    _inherited_members.setdefault(attr.name, ob.InheritedMember(
+    _mro = ob.mro
+    if not _mro:
+        return []
+    # Names defined in the classes that come before in the MRO, they mask the members of the next classes.
+    masking = {o.name for o in _mro[0].members}
+    for i in range(1, len(_mro)):
+        base = _mro[i]
+        inherited_via: Optional[Tuple[pydocspec.Class, ...]] = None
+        for attr in base.members:
+            if attr.name not in masking and attr.name not in _inherited_members:
+                if inherited_via is None:
+                    # The chain of classes from the super-class to the class itself.
+                    inherited_via = tuple(reversed(_mro[:(i+1)]))
+                _inherited_members[attr.name] = ob.InheritedMember(
                                                     member=attr, 
-                                                    inherited_via=baselist))
+                                                    inherited_via=inherited_via)
+        masking.update(o.name for o in base.members)
                     
     return list(_inherited_members.values())
 
@@ -229,44 +265,14 @@ def inherited_members(ob: pydocspec.Class) -> List[pydocspec.ClassInheritedMembe
 #             # if subclass.isVisible:
 #             yield from overriding_subclasses(subclass, name, _firstcall=False)
 
-def _nested_bases(classobj: pydocspec.Class) -> Iterator[Tuple[pydocspec.Class, ...]]:
-    """
-    Helper function to retreive the complete list of base classes chains 
-    (represented by tuples) for a given Class. 
-    A chain of classes is used to compute the member inheritence from the 
-    first element to the last element of the chain.  
-    
-    The first yielded chain only contains the Class itself. 
-
-    Then for each of the super-classes respecting the MRO:
-        - the next yielded chain contains the super class and the class itself, 
-        - the the next yielded chain contains the super-super class, the super class and the class itself, etc...
-    """
-    _mro = classobj.mro
-    for i, _ in enumerate(_mro):
-        yield tuple(reversed(_mro[:(i+1)]))
-
-def _unmasked_attrs(baselist: Sequence[pydocspec.Class]) -> List[pydocspec.ApiObject]:
-    """
-    Helper function to reteive the list of inherited children 
-    given a base classes chain (As yielded by `nested_bases`). 
-    
-    The returned members are inherited from the Class listed 
-    first in the chain to the Class listed last: they are not overriden in between. 
-    """
-    maybe_masking = {
-        o.name
-        for b in baselist[1:]
-        for o in b.members
-        }
-    return [ o for o in baselist[0].members
-             if o.name not in maybe_masking ]
-
-def is_abstractclass(ob: 'pydocspec.Class') -> bool:
+def is_abstractclass(ob: 'pydocspec.Class', 
+                     function_flags: Optional[Dict[_model.Function, func_attr.FunctionFlags]] = None) -> bool:
     """
     Returns whether the given class is an abstract class. 
 
     Must be set after Class.inherited_members.
+
+    :param function_flags: Optional cache passed to `func_attr.analyze`.
     """
     # Check for explicit metaclass=ABCMeta on this specific class.
     meta = ob.metaclass
@@ -278,11 +284,13 @@ def is_abstractclass(ob: 'pydocspec.Class') -> bool:
         # For a class to be abstract, it must extend abc.ABC.
         return False
     
-    for method in filter(lambda o:isinstance(o, pydocspec.Function), 
-                    ob.members + [o.member for o in ob.inherited_members]):
-        
-        assert isinstance(method, pydocspec.Function)
-        if func_attr.is_abstractmethod(method):
+    for method in ob.members:
+        if isinstance(method, pydocspec.Function) and func_attr.analyze(method, function_flags).is_abstractmethod:
+            return True
+    
+    for inherited in ob.inherited_members:
+        method = inherited.member
+        if isinstance(method, pydocspec.Function) and func_attr.analyze(method, function_flags).is_abstractmethod:
             return True
     
     return False
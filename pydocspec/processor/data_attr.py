@@ -33,7 +33,7 @@ def is_constant(ob: pydocspec.Variable) -> bool: # still uses expand_name
 def is_type_alias(ob: pydocspec.Variable) -> bool:
     if ob.value_ast is not None:
         if ob.datatype_ast is not None:
-            if helpers.is_using_annotations(ob.datatype_ast, ('typing.TypeAlias'), ob):
+            if helpers.is_using_annotations(ob.datatype_ast, ('typing.TypeAlias',), ob):
                 try:
                     ob.value_ast = astroidutils.unstring_annotation(ob.value_ast)
                 except SyntaxError:
@@ -49,7 +49,8 @@ def process_aliases(ob: pydocspec.Variable) -> None:
     if ob.is_alias:
         assert ob.value is not None
         alias_to = ob.resolve_name(ob.value)
-        if alias_to is not None and ob not in alias_to.aliases:
+        if alias_to is not None and ob not in alias_to._aliases_set:
+            alias_to._aliases_set.add(ob)
             alias_to.aliases.append(ob)
 
 def doc_sources(ob: pydocspec.ApiObject) -> List[pydocspec.ApiObject]:
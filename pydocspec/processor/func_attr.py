@@ -1,31 +1,26 @@
 """
 Helpers to populate attributes of `Function` instances. 
 """
+from typing import Dict, NamedTuple, Optional
 
 import pydocspec
 from pydocspec import _model, astroidutils
 
+ABC_METHODS = {
+    "abc.abstractproperty",
+    "abc.abstractmethod",
+    "abc.abstractclassmethod",
+    "abc.abstractstaticmethod",
+}
 
 def is_property(ob: pydocspec.Function) -> bool:
-    for deco in ob.decorations or ():
-        name = astroidutils.node2fullname(deco.name_ast, ob.scope)
-        if name and name.endswith(('property', 'Property')):
-            return True
-    return False
+    return analyze(ob).is_property
 
 def is_property_setter(ob: _model.Function) -> bool:
-    for deco in ob.decorations or ():
-        name = astroidutils.node2dottedname(deco.name_ast)
-        if name and len(name) == 2 and name[0]==ob.name and name[1] == 'setter':
-            return True
-    return False
+    return analyze(ob).is_property_setter
 
 def is_property_deleter(ob: _model.Function) -> bool:
-    for deco in ob.decorations or ():
-        name = astroidutils.node2dottedname(deco.name_ast)
-        if name and len(name) == 2 and name[0]==ob.name and name[1] == 'deleter':
-            return True
-    return False
+    return analyze(ob).is_property_deleter
 
 def is_async(ob: _model.Function) -> bool:
     return 'async' in (ob.modifiers or ())
@@ -34,26 +29,76 @@ def is_method(ob: _model.Function) -> bool:
     return isinstance(ob.scope, _model.Class)
 
 def is_classmethod(ob: pydocspec.Function) -> bool:
-    for deco in ob.decorations or ():
-        if astroidutils.node2fullname(deco.name_ast, ob.scope) in ('classmethod', "abc.abstractclassmethod"):
-            return True
-    return False
+    return analyze(ob).is_classmethod
 
 def is_staticmethod(ob: pydocspec.Function) -> bool:
-    for deco in ob.decorations or ():
-        if astroidutils.node2fullname(deco.name_ast, ob.scope) in ('staticmethod', "abc.abstractstaticmethod"):
-            return True
-    return False
-
-ABC_METHODS = {
-    "abc.abstractproperty",
-    "abc.abstractmethod",
-    "abc.abstractclassmethod",
-    "abc.abstractstaticmethod",
-}
+    return analyze(ob).is_staticmethod
 
 def is_abstractmethod(ob: pydocspec.Function) -> bool:
+    return analyze(ob).is_abstractmethod
+
+class FunctionFlags(NamedTuple):
+    """
+    The boolean attributes of a `pydocspec.Function`, as computed by `analyze`.
+    """
+    is_property: bool
+    is_property_setter: bool
+    is_property_deleter: bool
+    is_async: bool
+    is_method: bool
+    is_classmethod: bool
+    is_staticmethod: bool
+    is_abstractmethod: bool
+
+def analyze(ob: _model.Function, 
+            flags_cache: Optional[Dict[_model.Function, FunctionFlags]] = None) -> FunctionFlags:
+    """
+    Compute all function flags at once, the decorations are iterated once. 
+    
+    The ``is_*`` functions of this module are shortcuts to this function.
+
+    :param flags_cache: Optional mapping of functions to their flags, shared between calls 
+        since `class_attr.is_abstractclass` needs the flags of methods that have not been visited yet.
+        It should not outlive the processing of the tree.
+    """
+    if flags_cache is None:
+        return _analyze(ob)
+    try:
+        return flags_cache[ob]
+    except KeyError:
+        flags = flags_cache[ob] = _analyze(ob)
+        return flags
+
+def _analyze(ob: _model.Function) -> FunctionFlags:
+    is_property = is_property_setter = is_property_deleter = False
+    is_classmethod = is_staticmethod = is_abstractmethod = False
+    
     for deco in ob.decorations or ():
-        if astroidutils.node2fullname(deco.name_ast, ob.scope) in ABC_METHODS:
-            return True
-    return False
\ No newline at end of file
+        dottedname = astroidutils.node2dottedname(deco.name_ast)
+        if not dottedname:
+            continue
+        
+        if len(dottedname) == 2 and dottedname[0] == ob.name:
+            if dottedname[1] == 'setter':
+                is_property_setter = True
+            elif dottedname[1] == 'deleter':
+                is_property_deleter = True
+        
+        fullname = ob.scope.expand_name('.'.join(dottedname))
+        if fullname.endswith(('property', 'Property')):
+            is_property = True
+        if fullname in ('classmethod', "abc.abstractclassmethod"):
+            is_classmethod = True
+        if fullname in ('staticmethod', "abc.abstractstaticmethod"):
+            is_staticmethod = True
+        if fullname in ABC_METHODS:
+            is_abstractmethod = True
+
+    return FunctionFlags(is_property=is_property, 
+                         is_property_setter=is_property_setter, 
+                         is_property_deleter=is_property_deleter, 
+                         is_async=is_async(ob), 
+                         is_method=is_method(ob), 
+                         is_classmethod=is_classmethod, 
+                         is_staticmethod=is_staticmethod, 
+                         is_abstractmethod=is_abstractmethod)
@@ -2,7 +2,7 @@
 Helpers to help the helpers.
 """
 
-from typing import Optional, Sequence, Union
+from typing import Collection, Optional, Union
 
 import astroid.nodes
 import pydocspec
@@ -14,12 +14,12 @@ def ast2apiobject(root: _model.TreeRoot, node: Union['astroid.nodes.ClassDef',
     values = root.all_objects.getall(node.qname())
     if not values: 
         return None
-    for sameloc in filter(
-        lambda ob: ob.location is not None \
-            and ob.location.lineno is not None \
-                and ob.location.lineno==node.lineno, values):
-        assert isinstance(sameloc, (pydocspec.Class, pydocspec.Module))
-        return sameloc
+    lineno = node.lineno
+    for ob in values:
+        location = ob.location
+        if location is not None and location.lineno is not None and location.lineno == lineno:
+            assert isinstance(ob, (pydocspec.Class, pydocspec.Module))
+            return ob
     return None
 
 # TODO: ctx here is not required since we could expand the annotation name with astutils.resolve_qualname()
@@ -28,33 +28,28 @@ def ast2apiobject(root: _model.TreeRoot, node: Union['astroid.nodes.ClassDef',
 # in the system. So, recap, it's not recommended to use the naming system in the builder, 
 # BUT when resolving import names, there is good chance that the indirection is already created, so it's ok.
 
+_FINAL = frozenset(("typing.Final", "typing_extensions.Final"))
+_CLASSVAR = frozenset(('typing.ClassVar', "typing_extensions.ClassVar"))
+
 def is_using_typing_final(expr: Optional[astroid.nodes.NodeNG], 
                     ctx:pydocspec.ApiObject) -> bool:
-    return is_using_annotations(expr, ("typing.Final", "typing_extensions.Final"), ctx)
+    return is_using_annotations(expr, _FINAL, ctx)
 
 def is_using_typing_classvar(expr: Optional[astroid.nodes.NodeNG], 
                     ctx:pydocspec.ApiObject) -> bool:
-    return is_using_annotations(expr, ('typing.ClassVar', "typing_extensions.ClassVar"), ctx)
+    return is_using_annotations(expr, _CLASSVAR, ctx)
 
 def is_using_annotations(expr: Optional[astroid.nodes.NodeNG], 
-                            annotations:Sequence[str], 
+                            annotations:Collection[str], 
                             ctx:pydocspec.ApiObject) -> bool:
     """
     Detect if this expr is firstly composed by one of the specified annotation(s)' full name.
     """
-    full_name = astroidutils.node2fullname(expr, ctx)
-    if full_name in annotations:
-        return True
-    if isinstance(expr, astroid.nodes.Subscript):
-        # Final[...] or typing.Final[...] expressions
-        if isinstance(expr.value, (astroid.nodes.Name, astroid.nodes.Attribute)):
-            value = expr.value
-            full_name = astroidutils.node2fullname(value, ctx)
-            if full_name in annotations:
-                return True
-    return False
+    # node2fullname() strips the subscript slice, so this also 
+    # matches Final[...] or typing.Final[...] expressions.
+    return astroidutils.node2fullname(expr, ctx) in annotations
 
-TYPING_ALIAS = (
+TYPING_ALIAS = frozenset((
         "typing.Hashable",
         "typing.Awaitable",
         "typing.Coroutine",
@@ -100,9 +95,9 @@ TYPING_ALIAS = (
         "typing.Union",
         "typing.Literal",
         "typing.Optional",
-    )
+    ))
 
-SUBSCRIPTABLE_CLASSES_PEP585 = (
+SUBSCRIPTABLE_CLASSES_PEP585 = frozenset((
         "tuple",
         "list",
         "dict",
@@ -141,11 +136,12 @@ SUBSCRIPTABLE_CLASSES_PEP585 = (
         "contextlib.AbstractAsyncContextManager",
         "re.Pattern",
         "re.Match",
-    )
+    ))
+
+_TYPING_OR_PEP585 = TYPING_ALIAS | SUBSCRIPTABLE_CLASSES_PEP585
 
 def is_typing_annotation(node: astroid.nodes.NodeNG, ctx: 'pydocspec.ApiObject') -> bool:
     """
     Whether this annotation node refers to a typing alias.
     """
-    return is_using_annotations(node, TYPING_ALIAS, ctx) or \
-            is_using_annotations(node, SUBSCRIPTABLE_CLASSES_PEP585, ctx)
+    return is_using_annotations(node, _TYPING_OR_PEP585, ctx)
@@ -18,6 +18,8 @@ def dunder_all(ob: _model.Module) -> Optional[List[str]]:
     
     if ob._ast is not None:
         # Infer the __all__ variable with astroid inference system.
+        # Inference can't be skipped when the value is already a literal list, since it might be modified 
+        # later in the module (i.e. with __all__ += [...] or __all__.extend([...])).
         ivalue = list(ob._ast.igetattr("__all__"))[-1] # Last assignment inference.
         if ivalue != astroid.util.Uninferable:
             assert isinstance(ivalue, astroid.nodes.NodeNG)
@@ -81,10 +83,18 @@ def public_names(ob: _model.Module) -> List[str]:
     :note: This is used to resolve wildcard imports when no `__all__` variable is
         defined.
     """
-    return list(dict.fromkeys([name for name in (m.name for m in ob.members if \
-        not ((isinstance(m, _model.Indirection) and m.is_type_guarged) \
-            or isinstance(m, _model.Module)) )
-            if not name.startswith('_')]))
+    names = []
+    seen = set()
+    for m in ob.members:
+        name = m.name
+        if name[:1] == '_' or name in seen:
+            continue
+        if isinstance(m, _model.Module) or \
+           (isinstance(m, _model.Indirection) and m.is_type_guarged):
+            continue
+        seen.add(name)
+        names.append(name)
+    return names
     
     # Maybe the following rationale is better:
     # Even if submodules are not imported when wildcard importing a module, 
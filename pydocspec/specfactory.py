@@ -2,22 +2,26 @@
 Create customizable docspec classes. 
 """
 import logging
-from typing import Dict, List, Type, Any, Union, Sequence
+from typing import Dict, Iterable, List, Type, Any, Union
 
 import pydocspec
 
+_LOG = logging.getLogger('pydocspec')
+
 class GenericFactory:
 
     def __init__(self, bases: Dict[str, Type[Any]]) -> None:
         self.bases = bases
         self.mixins: Dict[str, List[Type[Any]]] = {}
+        # Classes created by get_class(), such that all objects of the same kind share the same class.
+        self._classes: Dict[str, Type[Any]] = {}
 
     def add_mixin(self, for_class: str, mixin:Type[Any]) -> None:
         """
         Add a mixin class to the specied object in the factory. 
         """
-        if for_class not in list(self.bases):
-            logging.getLogger('pydocspec').warning(f"Invalid class name. Cannot add mixin class {mixin!r} on class '{for_class}'. Possible classes are {', '.join(self.bases.keys())}")
+        if for_class not in self.bases:
+            _LOG.warning(f"Invalid class name. Cannot add mixin class {mixin!r} on class '{for_class}'. Possible classes are {', '.join(self.bases.keys())}")
             return
         
         try:
@@ -27,9 +31,14 @@ class GenericFactory:
             self.mixins[for_class] = mixins
         
         assert isinstance(mixins, list)
+        if mixin in mixins:
+            # type() would fail with a duplicate base class.
+            return
         mixins.append(mixin)
+        # the class needs to be re-created with the new mixin.
+        self._classes.pop(for_class, None)
 
-    def add_mixins(self, **kwargs:Union[Sequence[Type[Any]], Type[Any]]) -> None:
+    def add_mixins(self, **kwargs:Union[Iterable[Type[Any]], Type[Any]]) -> None:
         """
         Add mixin classes to objects in the factory. 
 
@@ -42,17 +51,23 @@ class GenericFactory:
         :param kwargs: Minin(s) classes to apply to names.
         """
         for key,value in kwargs.items():
-            if isinstance(value, Sequence):
+            if isinstance(value, type):
+                self.add_mixin(key, value)
+            else:
                 for item in value:
                     self.add_mixin(key, item)
-            else:
-                self.add_mixin(key, value)
 
     def get_class(self, name:str) -> Type[Any]:
         try:
-            return type(name, tuple([self.bases[name]]+self.mixins.get(name, [])), {})
+            return self._classes[name]
+        except KeyError:
+            pass
+        try:
+            klass = type(name, tuple([self.bases[name]]+self.mixins.get(name, [])), {})
         except KeyError as e:
             raise ValueError(f"Invalid class name: '{name}'") from e
+        self._classes[name] = klass
+        return klass
 
 class Factory(GenericFactory):
     """
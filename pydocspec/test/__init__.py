@@ -1,8 +1,6 @@
 
 
-import os
 from pathlib import Path
-import tempfile
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple, Union, overload
 import sys
 import io
@@ -97,10 +95,12 @@ class _default_astbuilder:
         assert isinstance(_mod, pydocspec.Module)
         return _mod
 
+_OPTIONAL_EXTENSIONS_OPTIONS = Options(load_optional_extensions=True)
+
 class _optional_extensions_enabled:
     @staticmethod
     def mod_from_text(text:str, modname:str='test') -> 'pydocspec.Module':
-        return _default_astbuilder.mod_from_text(text, modname, Options(load_optional_extensions=True))
+        return _default_astbuilder.mod_from_text(text, modname, _OPTIONAL_EXTENSIONS_OPTIONS)
 
 class _back_converter_round_trip1:
     @staticmethod
@@ -120,18 +120,11 @@ class _back_converter_round_trip1:
         for m in docspec_mods:
             raw_docspec_json['modules'].append(_docspec.upstream.docspec.dump_module(m))
         
-        tmp = tempfile.gettempdir() + os.sep + '_docspec_modules.json'
-        
-        with open(tmp, 'w') as f:
-            json.dump(raw_docspec_json, f)
+        # Round trip through JSON in memory.
+        data = json.loads(json.dumps(raw_docspec_json))
         
         new_docspec_mods: List['docspec.Module'] = []
-
-        with open(tmp, 'r') as f:
-            data = json.load(f)
-            new_docspec_mods.extend(_docspec.upstream.docspec.load_modules(data['modules']))
-        
-        os.remove(tmp)
+        new_docspec_mods.extend(_docspec.upstream.docspec.load_modules(data['modules']))
 
         new_root = converter.convert_docspec_modules(new_docspec_mods)
         _mod = new_root.all_objects[modname]
@@ -150,7 +143,7 @@ mod_from_text_param = pytest.mark.parametrize(
 
 getbuilder_param = pytest.mark.parametrize(
     'getbuilder', (builder_from_options, 
-            lambda: builder_from_options(Options(load_optional_extensions=True)))
+            lambda: builder_from_options(_OPTIONAL_EXTENSIONS_OPTIONS))
     )
 
 load_python_modules_param = pytest.mark.parametrize(
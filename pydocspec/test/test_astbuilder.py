@@ -1,4 +1,4 @@
-from typing import Callable, cast
+from typing import Callable, List, Tuple, cast
 import ast
 import sys
 import pytest
@@ -723,13 +723,16 @@ def test_inherited_members(getbuilder: Callable[[], astbuilder.Builder]) -> None
     assert isinstance(SubClassWithInnerClass, pydocspec.Class)
     assert isinstance(Diamond, pydocspec.Class)
 
+    def _inherited_members_names(klass: pydocspec.Class) -> List[Tuple[str, Tuple[str, ...]]]:
+        return [(m.member.full_name, tuple(_m.full_name for _m in m.inherited_via)) for m in klass.inherited_members]
+
     # Currently, we do not inclue default 'builtin.object' in the system, 
     # so it doesn't show up here.
     assert len(Subclass.mro) == 3
     assert len(SubSubclass.mro) == 5
     assert len(_BaseClass.inherited_members) == 0
     
-    assert [(m.member.full_name, tuple(_m.full_name for _m in m.inherited_via)) for m in Diamond.inherited_members] == [
+    assert _inherited_members_names(Diamond) == [
               ('subclass.C.myAttribute',
                ('subclass.C',
                 'subclass.Diamond')),
@@ -740,13 +743,13 @@ def test_inherited_members(getbuilder: Callable[[], astbuilder.Builder]) -> None
                 'subclass.Diamond')),
     ]
 
-    assert [(m.member.full_name, tuple(_m.full_name for _m in m.inherited_via)) for m in SubClassWithInnerClass.inherited_members] == [
+    assert _inherited_members_names(SubClassWithInnerClass) == [
               ('base._BaseClassWithInnerClass.Inner',
                ('base._BaseClassWithInnerClass',
                 'subclass.SubClassWithInnerClass')),
     ]
     
-    assert [(m.member.full_name, tuple(_m.full_name for _m in m.inherited_via)) for m in Subclass.inherited_members] == [
+    assert _inherited_members_names(Subclass) == [
         ('base._BaseClass.__init__',
                ('base._BaseClass',
                 'subclass.Subclass')
@@ -766,7 +769,7 @@ def test_inherited_members(getbuilder: Callable[[], astbuilder.Builder]) -> None
         )
     ]
 
-    assert [(m.member.full_name, tuple(_m.full_name for _m in m.inherited_via)) for m in SubSubclass.inherited_members] == [
+    assert _inherited_members_names(SubSubclass) == [
         ('subclass._SubSubclassBase.lang',
                ('subclass._SubSubclassBase',
                 'subclass.SubSubclass')
@@ -889,3 +892,36 @@ def test_type_alias(mod_from_text: ModFromTextFunction, caplog:CapLog) -> None:
     assert var3.is_type_alias == False
     assert literal_eval(var3.value_ast) == '1243'
     assert var4.is_type_alias == True
+
+@mod_from_text_param
+def test_property_getter_not_shadowed(mod_from_text: ModFromTextFunction) -> None:
+    mod = mod_from_text('''
+    class A:
+        @property
+        def p(self):
+            """getter"""
+        @p.setter
+        def p(self, v):
+            """setter"""
+        @p.deleter
+        def p(self):
+            """deleter"""
+    ''', modname='test')
+    prop = mod.root.all_objects['test.A.p']
+    assert isinstance(prop, pydocspec.Function)
+    assert prop.is_property == True
+    assert prop.docstring is not None
+    assert prop.docstring.content == 'getter'
+
+@mod_from_text_param
+def test_type_alias_non_name_annotation(mod_from_text: ModFromTextFunction) -> None:
+    mod = mod_from_text('''
+    x: int | None = 3
+    y: f() = 3
+    ''',  modname='test')
+    x = mod.get_member('x')
+    y = mod.get_member('y')
+    assert isinstance(x, pydocspec.Variable)
+    assert isinstance(y, pydocspec.Variable)
+    assert x.is_type_alias == False
+    assert y.is_type_alias == False
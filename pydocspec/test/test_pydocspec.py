@@ -125,3 +125,20 @@ if _docspec.upstream.docspec is not None:
                                     modifiers=[], 
                                     return_type='str', 
                                     decorations=[],)
+
+def test_factory_classes_are_reused() -> None:
+    from pydocspec import specfactory
+    factory = specfactory.Factory()
+    klass = factory.Class
+    assert factory.Class is klass
+
+    class ClassMixin:
+        ...
+
+    factory.add_mixin('Class', ClassMixin)
+    assert factory.Class is not klass
+    assert issubclass(factory.Class, ClassMixin)
+    assert factory.Class is factory.Class
+
+    factory.add_mixin('Class', ClassMixin)
+    assert factory.mixins['Class'] == [ClassMixin]
@@ -1,3 +1,6 @@
+import sys
+from typing import List
+
 import pydocspec
 from pydocspec import visitors, genericvisitor, _docspec
 from pydocspec.visitors import PrintVisitor, FilterVisitor
@@ -180,3 +183,61 @@ After               .depart(a)
 MainVistor          .depart(a)
 Before              .depart(a)
 """
+
+class _Node:
+    def __init__(self, name: str, *children: '_Node') -> None:
+        self.name = name
+        self.children = list(children)
+
+class _NodeVisitor(genericvisitor.Visitor[_Node]):
+    def __init__(self) -> None:
+        self.events: List[str] = []
+    @classmethod
+    def get_children(cls, ob: _Node) -> List[_Node]: #type:ignore[override]
+        return ob.children
+    def unknown_visit(self, ob: _Node) -> None:
+        self.events.append(f'visit {ob.name}')
+        if ob.name.startswith('skipnode'):
+            raise self.SkipNode()
+        if ob.name.startswith('skipchildren'):
+            raise self.SkipChildren()
+        if ob.name.startswith('skipsiblings'):
+            raise self.SkipSiblings()
+        if ob.name.startswith('skipdeparture'):
+            raise self.SkipDeparture()
+    def unknown_departure(self, ob: _Node) -> None:
+        self.events.append(f'depart {ob.name}')
+
+def test_walk_tree_pruning() -> None:
+    tree = _Node('root', 
+                _Node('skipnode', _Node('a')), 
+                _Node('skipchildren', _Node('b')), 
+                _Node('c', _Node('skipsiblings', _Node('d')), _Node('e')), 
+                _Node('skipdeparture', _Node('f')),)
+    
+    v = _NodeVisitor()
+    v.walk(tree)
+    assert v.events == ['visit root', 'visit skipnode', 'visit skipchildren', 'visit c', 
+                        'visit skipsiblings', 'visit skipdeparture', 'visit f']
+    
+    v = _NodeVisitor()
+    v.walkabout(tree)
+    assert v.events == ['visit root', 'visit skipnode', 
+                        'visit skipchildren', 'depart skipchildren', 
+                        'visit c', 'visit skipsiblings', 'depart c', 
+                        'visit skipdeparture', 'visit f', 'depart f', 
+                        'depart root']
+
+def test_walk_deep_tree() -> None:
+    # the tree traversal is not limited by the recursion depth.
+    depth = sys.getrecursionlimit()*2
+    tree = leaf = _Node('0')
+    for i in range(1, depth):
+        new = _Node(str(i))
+        leaf.children.append(new)
+        leaf = new
+    
+    v = _NodeVisitor()
+    v.walkabout(tree)
+    assert len(v.events) == depth*2
+    assert v.events[-1] == 'depart 0'
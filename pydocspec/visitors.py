@@ -125,9 +125,12 @@ class ReprVisitor(ApiObjectVisitor):
   # for test purposes
   def __init__(self, full_name: bool = False, fields: t.Optional[t.Sequence[str]]=None) -> None:
     super().__init__()
-    self.repr: str = ''
+    self._lines: t.List[str] = []
     self.full_name = full_name
     self.fields = fields
+  @property
+  def repr(self) -> str:
+    return ''.join(self._lines)
   def unknown_visit(self, ob: 'pydocspec.ApiObject') -> None:
     depth = len(ob.path)-1
     
@@ -158,7 +161,7 @@ class ReprVisitor(ApiObjectVisitor):
       lineno = str(ob.location.lineno) if ob.location else 0,
       filename = ob.location.filename or '' if ob.location else '',
       other = other_fields_repr)
-    self.repr += '| ' * depth + "- {type} '{name}' at l.{lineno}{other}".format(**tokens) + "\n"
+    self._lines.append('| ' * depth + "- {type} '{name}' at l.{lineno}{other}".format(**tokens) + "\n")
 
 class PrintVisitor(ApiObjectVisitor):
   """